@@ -28,13 +28,17 @@ from google.api_core.operation import Operation
 from google.api_core.retry import Retry
 from google.cloud.dataproc_v1 import (
     Batch,
+    BatchControllerAsyncClient,
     BatchControllerClient,
     Cluster,
+    ClusterControllerAsyncClient,
     ClusterControllerClient,
     Job,
+    JobControllerAsyncClient,
     JobControllerClient,
     JobStatus,
     WorkflowTemplate,
+    WorkflowTemplateServiceAsyncClient,
     WorkflowTemplateServiceClient,
 )
 from google.protobuf.duration_pb2 import Duration
@@ -148,6 +152,31 @@ class DataProcJobBuilder:
         if pyfiles is not None:
             self.job["job"][self.job_type]["python_file_uris"] = pyfiles
 
+    def add_job_resources(
+        self,
+        args: Optional[List[str]] = None,
+        archives: Optional[List[str]] = None,
+        files: Optional[List[str]] = None,
+        pyfiles: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Set args, archives, files and python files for Dataproc job in one update.
+
+        :param args: Args for the job query.
+        :param archives: List of archives URIs
+        :param files: List of files URIs
+        :param pyfiles: List of python files URIs
+        """
+        resources = {
+            "args": args,
+            "archive_uris": archives,
+            "file_uris": files,
+            "python_file_uris": pyfiles,
+        }
+        self.job["job"][self.job_type].update(
+            {key: value for key, value in resources.items() if value is not None}
+        )
+
     def set_main(self, main_jar: Optional[str] = None, main_class: Optional[str] = None) -> None:
         """
         Set Dataproc main class.
@@ -197,6 +226,30 @@ class DataprocHook(GoogleBaseHook):
     keyword arguments rather than positional.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._client_cache: Dict[Tuple[type, Optional[str]], Any] = {}
+
+    def _get_client(self, client_class: type, region: Optional[str]) -> Any:
+        """Return a cached gapic client so its gRPC channel is reused across calls.
+
+        Channel setup costs DNS, TLS and HTTP/2 negotiation; caching per
+        (client class, region) lets every call through the same hook multiplex
+        on one channel.
+        """
+        cache_key = (client_class, region)
+        client = self._client_cache.get(cache_key)
+        if client is None:
+            client_options = None
+            if region and region != 'global':
+                client_options = {'api_endpoint': f'{region}-dataproc.googleapis.com:443'}
+            client = self._client_cache[cache_key] = client_class(
+                credentials=self._get_credentials(),
+                client_info=self.client_info,
+                client_options=client_options,
+            )
+        return client
+
     def get_cluster_client(
         self, region: Optional[str] = None, location: Optional[str] = None
     ) -> ClusterControllerClient:
@@ -209,13 +262,7 @@ class DataprocHook(GoogleBaseHook):
                 stacklevel=2,
             )
             region = location
-        client_options = None
-        if region and region != 'global':
-            client_options = {'api_endpoint': f'{region}-dataproc.googleapis.com:443'}
-
-        return ClusterControllerClient(
-            credentials=self._get_credentials(), client_info=self.client_info, client_options=client_options
-        )
+        return self._get_client(ClusterControllerClient, region)
 
     def get_template_client(
         self, region: Optional[str] = None, location: Optional[str] = None
@@ -229,13 +276,7 @@ class DataprocHook(GoogleBaseHook):
                 stacklevel=2,
             )
             region = location
-        client_options = None
-        if region and region != 'global':
-            client_options = {'api_endpoint': f'{region}-dataproc.googleapis.com:443'}
-
-        return WorkflowTemplateServiceClient(
-            credentials=self._get_credentials(), client_info=self.client_info, client_options=client_options
-        )
+        return self._get_client(WorkflowTemplateServiceClient, region)
 
     def get_job_client(
         self, region: Optional[str] = None, location: Optional[str] = None
@@ -249,13 +290,7 @@ class DataprocHook(GoogleBaseHook):
                 stacklevel=2,
             )
             region = location
-        client_options = None
-        if region and region != 'global':
-            client_options = {'api_endpoint': f'{region}-dataproc.googleapis.com:443'}
-
-        return JobControllerClient(
-            credentials=self._get_credentials(), client_info=self.client_info, client_options=client_options
-        )
+        return self._get_client(JobControllerClient, region)
 
     def get_batch_client(
         self, region: Optional[str] = None, location: Optional[str] = None
@@ -269,20 +304,15 @@ class DataprocHook(GoogleBaseHook):
                 stacklevel=2,
             )
             region = location
-        client_options = None
-        if region and region != 'global':
-            client_options = {'api_endpoint': f'{region}-dataproc.googleapis.com:443'}
-
-        return BatchControllerClient(
-            credentials=self._get_credentials(), client_info=self.client_info, client_options=client_options
-        )
+        return self._get_client(BatchControllerClient, region)
 
     def wait_for_operation(self, operation: Operation, timeout: Optional[float] = None):
         """Waits for long-lasting operation to complete."""
         try:
             return operation.result(timeout=timeout)
-        except Exception:
-            error = operation.exception(timeout=timeout)
+        except Exception as error:
+            # operation.exception() would block for up to another full timeout
+            # re-polling an operation whose outcome we already have.
             raise AirflowException(error)
 
     @GoogleBaseHook.fallback_to_default_project_id
@@ -1104,3 +1134,273 @@ class DataprocHook(GoogleBaseHook):
             metadata=metadata,
         )
         return result
+
+
+class DataprocAsyncHook(GoogleBaseHook):
+    """
+    Asynchronous hook for Google Cloud Dataproc APIs.
+
+    It exposes the subset of :class:`DataprocHook` methods that deferrable operators
+    poll from the triggerer. All the methods in the hook where project_id is used must
+    be called with keyword arguments rather than positional.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._client_cache: Dict[Tuple[type, Optional[str]], Any] = {}
+
+    def _get_client(self, client_class: type, region: Optional[str]) -> Any:
+        """Return a cached async gapic client so concurrent calls share one gRPC channel."""
+        cache_key = (client_class, region)
+        client = self._client_cache.get(cache_key)
+        if client is None:
+            client_options = None
+            if region and region != 'global':
+                client_options = {'api_endpoint': f'{region}-dataproc.googleapis.com:443'}
+            client = self._client_cache[cache_key] = client_class(
+                credentials=self._get_credentials(),
+                client_info=self.client_info,
+                client_options=client_options,
+            )
+        return client
+
+    def get_cluster_client(self, region: Optional[str] = None) -> ClusterControllerAsyncClient:
+        """Returns ClusterControllerAsyncClient."""
+        return self._get_client(ClusterControllerAsyncClient, region)
+
+    def get_template_client(self, region: Optional[str] = None) -> WorkflowTemplateServiceAsyncClient:
+        """Returns WorkflowTemplateServiceAsyncClient."""
+        return self._get_client(WorkflowTemplateServiceAsyncClient, region)
+
+    def get_batch_client(self, region: Optional[str] = None) -> BatchControllerAsyncClient:
+        """Returns BatchControllerAsyncClient."""
+        return self._get_client(BatchControllerAsyncClient, region)
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def get_batch(
+        self,
+        batch_id: str,
+        region: str,
+        project_id: str,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Batch:
+        """
+        Gets the batch workload resource representation.
+
+        :param batch_id: Required. The ID to use for the batch.
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param project_id: Required. The ID of the Google Cloud project that the cluster belongs to.
+        :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+            retried.
+        :param timeout: The amount of time, in seconds, to wait for the request to complete. Note that if
+            ``retry`` is specified, the timeout applies to each individual attempt.
+        :param metadata: Additional metadata that is provided to the method.
+        """
+        client = self.get_batch_client(region=region)
+        name = f"projects/{project_id}/regions/{region}/batches/{batch_id}"
+        result = await client.get_batch(
+            request={'name': name},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return result
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def create_batch(
+        self,
+        region: str,
+        project_id: str,
+        batch: Union[Dict, Batch],
+        batch_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        """
+        Creates a batch workload.
+
+        :param project_id: Required. The ID of the Google Cloud project that the cluster belongs to.
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param batch: Required. The batch to create.
+        :param batch_id: Optional. The ID to use for the batch, which will become the final component
+            of the batch's resource name.
+            This value must be 4-63 characters. Valid characters are /[a-z][0-9]-/.
+        :param request_id: Optional. A unique id used to identify the request. If the server receives two
+            ``CreateBatchRequest`` requests with the same id, then the second request will be ignored and
+            the first ``google.longrunning.Operation`` created and stored in the backend is returned.
+        :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+            retried.
+        :param timeout: The amount of time, in seconds, to wait for the request to complete. Note that if
+            ``retry`` is specified, the timeout applies to each individual attempt.
+        :param metadata: Additional metadata that is provided to the method.
+        """
+        client = self.get_batch_client(region=region)
+        parent = f'projects/{project_id}/regions/{region}'
+
+        result = await client.create_batch(
+            request={
+                'parent': parent,
+                'batch': batch,
+                'batch_id': batch_id,
+                'request_id': request_id,
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return result
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def delete_batch(
+        self,
+        batch_id: str,
+        region: str,
+        project_id: str,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        """
+        Deletes the batch workload resource.
+
+        :param batch_id: Required. The ID to use for the batch, which will become the final component
+            of the batch's resource name.
+            This value must be 4-63 characters. Valid characters are /[a-z][0-9]-/.
+        :param project_id: Required. The ID of the Google Cloud project that the cluster belongs to.
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+            retried.
+        :param timeout: The amount of time, in seconds, to wait for the request to complete. Note that if
+            ``retry`` is specified, the timeout applies to each individual attempt.
+        :param metadata: Additional metadata that is provided to the method.
+        """
+        client = self.get_batch_client(region=region)
+        name = f"projects/{project_id}/regions/{region}/batches/{batch_id}"
+
+        await client.delete_batch(
+            request={'name': name},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def list_batches(
+        self,
+        region: str,
+        project_id: str,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        """
+        Lists batch workloads.
+
+        :param project_id: Required. The ID of the Google Cloud project that the cluster belongs to.
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param page_size: Optional. The maximum number of batches to return in each response. The service
+            may return fewer than this value. The default page size is 20; the maximum page size is 1000.
+        :param page_token: Optional. A page token received from a previous ``ListBatches`` call.
+            Provide this token to retrieve the subsequent page.
+        :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+            retried.
+        :param timeout: The amount of time, in seconds, to wait for the request to complete. Note that if
+            ``retry`` is specified, the timeout applies to each individual attempt.
+        :param metadata: Additional metadata that is provided to the method.
+        """
+        client = self.get_batch_client(region=region)
+        parent = f'projects/{project_id}/regions/{region}'
+
+        result = await client.list_batches(
+            request={
+                'parent': parent,
+                'page_size': page_size,
+                'page_token': page_token,
+            },
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return result
+
+    def get_job_client(self, region: Optional[str] = None) -> JobControllerAsyncClient:
+        """Returns JobControllerAsyncClient."""
+        return self._get_client(JobControllerAsyncClient, region)
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def get_job(
+        self,
+        job_id: str,
+        project_id: str,
+        region: Optional[str] = None,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Job:
+        """
+        Gets the resource representation for a job in a project.
+
+        :param job_id: Required. The job ID.
+        :param project_id: Required. The ID of the Google Cloud project the job belongs to.
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+            retried.
+        :param timeout: The amount of time, in seconds, to wait for the request to complete. Note that if
+            ``retry`` is specified, the timeout applies to each individual attempt.
+        :param metadata: Additional metadata that is provided to the method.
+        """
+        client = self.get_job_client(region=region)
+        result = await client.get_job(
+            request={'project_id': project_id, 'region': region, 'job_id': job_id},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return result
+
+    async def get_operation(self, region: str, operation_name: str):
+        """
+        Gets the state of a long-running Dataproc operation.
+
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param operation_name: Required. The name of the operation resource.
+        """
+        client = self.get_template_client(region=region)
+        return await client.transport.operations_client.get_operation(name=operation_name)
+
+    @GoogleBaseHook.fallback_to_default_project_id
+    async def get_cluster(
+        self,
+        region: str,
+        cluster_name: str,
+        project_id: str,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Cluster:
+        """
+        Gets the resource representation for a cluster in a project.
+
+        :param project_id: Required. The ID of the Google Cloud project that the cluster belongs to.
+        :param region: Required. The Cloud Dataproc region in which to handle the request.
+        :param cluster_name: Required. The cluster name.
+        :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+            retried.
+        :param timeout: The amount of time, in seconds, to wait for the request to complete. Note that if
+            ``retry`` is specified, the timeout applies to each individual attempt.
+        :param metadata: Additional metadata that is provided to the method.
+        """
+        client = self.get_cluster_client(region=region)
+        result = await client.get_cluster(
+            request={'project_id': project_id, 'region': region, 'cluster_name': cluster_name},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return result
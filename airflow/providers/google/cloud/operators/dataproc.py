@@ -18,6 +18,8 @@
 #
 """This module contains Google Dataproc operators."""
 
+import asyncio
+import hashlib
 import inspect
 import ntpath
 import os
@@ -25,26 +27,40 @@ import re
 import time
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from google.api_core import operation  # type: ignore
 from google.api_core.exceptions import AlreadyExists, NotFound
 from google.api_core.retry import Retry, exponential_sleep_generator
-from google.cloud.dataproc_v1 import Batch, Cluster
+from google.cloud.dataproc_v1 import Batch, Cluster, ClusterStatus
 from google.protobuf.duration_pb2 import Duration
 from google.protobuf.field_mask_pb2 import FieldMask
+from google.protobuf.json_format import MessageToJson
 
+from airflow.compat.functools import cached_property
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator, BaseOperatorLink, XCom
-from airflow.providers.google.cloud.hooks.dataproc import DataprocHook, DataProcJobBuilder
+from airflow.providers.google.cloud.hooks.dataproc import DataprocAsyncHook, DataprocHook, DataProcJobBuilder
 from airflow.providers.google.cloud.hooks.gcs import GCSHook
+from airflow.providers.google.cloud.triggers.dataproc import (
+    DataprocBatchTrigger,
+    DataprocClusterTrigger,
+    DataprocOperationTrigger,
+    DataprocSubmitTrigger,
+)
 from airflow.utils import timezone
 
 if TYPE_CHECKING:
     from airflow.utils.context import Context
 
 
+INIT_ACTION_TIMEOUT_PATTERN = re.compile(r"^(\d+)([sm])$")
+GRACEFUL_DECOMMISSION_TIMEOUT_PATTERN = re.compile(r"^(\d+)([smdh])$")
+TIMEOUT_UNIT_SECONDS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
 DATAPROC_BASE_LINK = "https://console.cloud.google.com/dataproc"
 DATAPROC_JOB_LOG_LINK = DATAPROC_BASE_LINK + "/jobs/{job_id}?region={region}&project={project_id}"
 DATAPROC_CLUSTER_LINK = (
@@ -52,24 +68,134 @@ DATAPROC_CLUSTER_LINK = (
 )
 
 
+DATAPROC_QUERY_JOB_TEMPLATE_FIELDS: Sequence[str] = (
+    'query',
+    'variables',
+    'job_name',
+    'cluster_name',
+    'region',
+    'dataproc_jars',
+    'dataproc_properties',
+    'impersonation_chain',
+)
+DATAPROC_JAR_JOB_TEMPLATE_FIELDS: Sequence[str] = (
+    'arguments',
+    'job_name',
+    'cluster_name',
+    'region',
+    'dataproc_jars',
+    'dataproc_properties',
+    'impersonation_chain',
+)
+
+_DEPRECATED_SUBMIT_MESSAGE = (
+    "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
+    " `generate_job` method of `{cls}` to generate dictionary representing your job"
+    " and use it with the new operator."
+)
+_DEPRECATED_SCALE_MESSAGE = (
+    "The `{cls}` operator is deprecated, please use `DataprocUpdateClusterOperator` instead."
+)
+
+_DEPRECATION_WARNED: Set[type] = set()
+
+
+def _warn_deprecated_operator(cls: type, message_template: str) -> None:
+    """Emit an operator deprecation warning once per class per process."""
+    if cls in _DEPRECATION_WARNED:
+        return
+    _DEPRECATION_WARNED.add(cls)
+    warnings.warn(message_template.format(cls=cls.__name__), DeprecationWarning, stacklevel=3)
+
+
+# Files above this size are uploaded to GCS as concurrently-uploaded chunks which
+# are then composed into a single object. GCS compose accepts at most 32 components.
+PARALLEL_UPLOAD_CHUNK_SIZE = 100 * 1024 * 1024
+PARALLEL_UPLOAD_MAX_PARTS = 32
+# Each in-flight part is buffered in memory, so the number of upload threads is
+# also bounded by this budget.
+PARALLEL_UPLOAD_BUFFER_LIMIT = 512 * 1024 * 1024
+
+# Files up to this size are read from disk once and both hashed and uploaded
+# from the in-memory buffer instead of being read twice.
+SINGLE_READ_UPLOAD_SIZE = 4 * 1024 * 1024
+
+_JOB_ID_GETTER = attrgetter("reference.job_id")
+
+_BATCH_SUMMARY_GETTER = attrgetter('name', 'uuid', 'state', 'state_message', 'create_time', 'labels')
+
+
+def _batch_to_summary_dict(batch: Batch) -> dict:
+    """Convert a batch proto to a dict of its commonly used fields.
+
+    Direct attribute access skips the descriptor reflection that
+    ``Batch.to_dict`` performs for every field, which dominates when a
+    listing returns thousands of entries.
+    """
+    name, batch_uuid, state, state_message, create_time, labels = _BATCH_SUMMARY_GETTER(batch)
+    return {
+        'name': name,
+        'uuid': batch_uuid,
+        'state': state.name,
+        'state_message': state_message,
+        'create_time': str(create_time),
+        'labels': dict(labels),
+    }
+
+
+_CONFIG_BUCKET_CACHE: Dict[Tuple[Optional[str], str, str], str] = {}
+
+# Batches in a terminal state never change again, so their representations can
+# be shared by every task in the process that looks them up. The cache is
+# bounded so long-lived workers do not accumulate every batch ever fetched,
+# and deletes evict their entry because a batch id is reusable once deleted.
+_TERMINAL_BATCH_CACHE: Dict[Tuple[Optional[str], str, str], dict] = {}
+_TERMINAL_BATCH_CACHE_MAX_SIZE = 128
+_TERMINAL_BATCH_STATES = ('SUCCEEDED', 'FAILED', 'CANCELLED')
+
+
+def _get_config_bucket(hook: DataprocHook, project_id: Optional[str], region: str, cluster_name: str) -> str:
+    """Return the cluster's config bucket, cached per cluster to avoid repeated RPCs."""
+    cache_key = (project_id, region, cluster_name)
+    bucket = _CONFIG_BUCKET_CACHE.get(cache_key)
+    if bucket is None:
+        cluster_info = hook.get_cluster(project_id=project_id, region=region, cluster_name=cluster_name)
+        bucket = _CONFIG_BUCKET_CACHE[cache_key] = cluster_info['config']['config_bucket']
+    return bucket
+
+
+_HOOK_CACHE: Dict[Tuple, DataprocHook] = {}
+
+
+def _cached_dataproc_hook(
+    gcp_conn_id: str, impersonation_chain: Optional[Union[str, Sequence[str]]] = None
+) -> DataprocHook:
+    """Return a DataprocHook shared by all operators using the same connection settings."""
+    cache_key = (
+        gcp_conn_id,
+        tuple(impersonation_chain) if isinstance(impersonation_chain, list) else impersonation_chain,
+    )
+    hook = _HOOK_CACHE.get(cache_key)
+    if hook is None:
+        hook = _HOOK_CACHE[cache_key] = DataprocHook(
+            gcp_conn_id=gcp_conn_id, impersonation_chain=impersonation_chain
+        )
+    return hook
+
+
 class DataprocJobLink(BaseOperatorLink):
     """Helper class for constructing Dataproc Job link"""
 
     name = "Dataproc Job"
 
     def get_link(self, operator, dttm):
+        # The conf cannot be cached across renderings: clearing a task rewrites
+        # the XCom with a fresh job id, so every lookup must hit the source.
         job_conf = XCom.get_one(
             key="job_conf", dag_id=operator.dag.dag_id, task_id=operator.task_id, execution_date=dttm
         )
-        return (
-            DATAPROC_JOB_LOG_LINK.format(
-                job_id=job_conf["job_id"],
-                region=job_conf["region"],
-                project_id=job_conf["project_id"],
-            )
-            if job_conf
-            else ""
-        )
+        # The pushed conf carries exactly the keys the link template needs.
+        return DATAPROC_JOB_LOG_LINK.format_map(job_conf) if job_conf else ""
 
 
 class DataprocClusterLink(BaseOperatorLink):
@@ -81,15 +207,7 @@ class DataprocClusterLink(BaseOperatorLink):
         cluster_conf = XCom.get_one(
             key="cluster_conf", dag_id=operator.dag.dag_id, task_id=operator.task_id, execution_date=dttm
         )
-        return (
-            DATAPROC_CLUSTER_LINK.format(
-                cluster_name=cluster_conf["cluster_name"],
-                region=cluster_conf["region"],
-                project_id=cluster_conf["project_id"],
-            )
-            if cluster_conf
-            else ""
-        )
+        return DATAPROC_CLUSTER_LINK.format_map(cluster_conf) if cluster_conf else ""
 
 
 class ClusterGenerator:
@@ -252,7 +370,7 @@ class ClusterGenerator:
             raise ValueError("Single node cannot have preemptible workers.")
 
     def _get_init_action_timeout(self) -> dict:
-        match = re.match(r"^(\d+)([sm])$", self.init_action_timeout)
+        match = INIT_ACTION_TIMEOUT_PATTERN.match(self.init_action_timeout)
         if match:
             val = float(match.group(1))
             if match.group(2) == "s":
@@ -266,61 +384,64 @@ class ClusterGenerator:
         )
 
     def _build_gce_cluster_config(self, cluster_data):
-        if self.zone:
-            zone_uri = f'https://www.googleapis.com/compute/v1/projects/{self.project_id}/zones/{self.zone}'
-            cluster_data['gce_cluster_config']['zone_uri'] = zone_uri
-
-        if self.metadata:
-            cluster_data['gce_cluster_config']['metadata'] = self.metadata
-
-        if self.network_uri:
-            cluster_data['gce_cluster_config']['network_uri'] = self.network_uri
-
-        if self.subnetwork_uri:
-            cluster_data['gce_cluster_config']['subnetwork_uri'] = self.subnetwork_uri
+        if self.internal_ip_only and not self.subnetwork_uri:
+            raise AirflowException("Set internal_ip_only to true only when you pass a subnetwork_uri.")
 
-        if self.internal_ip_only:
-            if not self.subnetwork_uri:
-                raise AirflowException("Set internal_ip_only to true only when you pass a subnetwork_uri.")
-            cluster_data['gce_cluster_config']['internal_ip_only'] = True
-
-        if self.tags:
-            cluster_data['gce_cluster_config']['tags'] = self.tags
-
-        if self.service_account:
-            cluster_data['gce_cluster_config']['service_account'] = self.service_account
-
-        if self.service_account_scopes:
-            cluster_data['gce_cluster_config']['service_account_scopes'] = self.service_account_scopes
+        zone_uri = (
+            f'https://www.googleapis.com/compute/v1/projects/{self.project_id}/zones/{self.zone}'
+            if self.zone
+            else None
+        )
+        gce_cluster_config = {
+            'zone_uri': zone_uri,
+            'metadata': self.metadata,
+            'network_uri': self.network_uri,
+            'subnetwork_uri': self.subnetwork_uri,
+            'internal_ip_only': self.internal_ip_only,
+            'tags': self.tags,
+            'service_account': self.service_account,
+            'service_account_scopes': self.service_account_scopes,
+        }
+        cluster_data['gce_cluster_config'] = {
+            key: value for key, value in gce_cluster_config.items() if value
+        }
 
         return cluster_data
 
     def _build_lifecycle_config(self, cluster_data):
-        if self.idle_delete_ttl:
-            cluster_data['lifecycle_config']['idle_delete_ttl'] = {"seconds": self.idle_delete_ttl}
-
-        if self.auto_delete_time:
-            utc_auto_delete_time = timezone.convert_to_utc(self.auto_delete_time)
-            cluster_data['lifecycle_config']['auto_delete_time'] = utc_auto_delete_time.strftime(
-                '%Y-%m-%dT%H:%M:%S.%fZ'
-            )
-        elif self.auto_delete_ttl:
-            cluster_data['lifecycle_config']['auto_delete_ttl'] = {"seconds": int(self.auto_delete_ttl)}
+        auto_delete_time = (
+            timezone.convert_to_utc(self.auto_delete_time).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+            if self.auto_delete_time
+            else None
+        )
+        lifecycle_config = {
+            'idle_delete_ttl': {"seconds": self.idle_delete_ttl} if self.idle_delete_ttl else None,
+            'auto_delete_time': auto_delete_time,
+            'auto_delete_ttl': (
+                {"seconds": int(self.auto_delete_ttl)}
+                if self.auto_delete_ttl and not self.auto_delete_time
+                else None
+            ),
+        }
+        cluster_data['lifecycle_config'] = {key: value for key, value in lifecycle_config.items() if value}
 
         return cluster_data
 
     def _build_cluster_data(self):
         if self.zone:
-            master_type_uri = (
-                f"projects/{self.project_id}/zones/{self.zone}/machineTypes/{self.master_machine_type}"
-            )
-            worker_type_uri = (
-                f"projects/{self.project_id}/zones/{self.zone}/machineTypes/{self.worker_machine_type}"
-            )
+            machine_type_base_uri = f"projects/{self.project_id}/zones/{self.zone}/machineTypes/"
+            master_type_uri = machine_type_base_uri + self.master_machine_type
+            worker_type_uri = machine_type_base_uri + self.worker_machine_type
         else:
             master_type_uri = self.master_machine_type
             worker_type_uri = self.worker_machine_type
 
+        # Primary and secondary workers use identical disks, so both configs can
+        # share one read-only dict.
+        worker_disk_config = {
+            'boot_disk_type': self.worker_disk_type,
+            'boot_disk_size_gb': self.worker_disk_size,
+        }
         cluster_data = {
             'gce_cluster_config': {},
             'master_config': {
@@ -334,36 +455,34 @@ class ClusterGenerator:
             'worker_config': {
                 'num_instances': self.num_workers,
                 'machine_type_uri': worker_type_uri,
-                'disk_config': {
-                    'boot_disk_type': self.worker_disk_type,
-                    'boot_disk_size_gb': self.worker_disk_size,
-                },
+                'disk_config': worker_disk_config,
             },
-            'secondary_worker_config': {},
+            'secondary_worker_config': (
+                {
+                    'num_instances': self.num_preemptible_workers,
+                    'machine_type_uri': worker_type_uri,
+                    'disk_config': worker_disk_config,
+                    'is_preemptible': True,
+                }
+                if self.num_preemptible_workers > 0
+                else {}
+            ),
             'software_config': {},
             'lifecycle_config': {},
-            'encryption_config': {},
-            'autoscaling_config': {},
-            'endpoint_config': {},
+            'encryption_config': (
+                {'gce_pd_kms_key_name': self.customer_managed_key} if self.customer_managed_key else {}
+            ),
+            'autoscaling_config': {'policy_uri': self.autoscaling_policy} if self.autoscaling_policy else {},
+            'endpoint_config': (
+                {'enable_http_port_access': self.enable_component_gateway}
+                if self.enable_component_gateway
+                else {}
+            ),
         }
-        if self.num_preemptible_workers > 0:
-            cluster_data['secondary_worker_config'] = {
-                'num_instances': self.num_preemptible_workers,
-                'machine_type_uri': worker_type_uri,
-                'disk_config': {
-                    'boot_disk_type': self.worker_disk_type,
-                    'boot_disk_size_gb': self.worker_disk_size,
-                },
-                'is_preemptible': True,
-            }
-
         if self.storage_bucket:
             cluster_data['config_bucket'] = self.storage_bucket
 
-        if self.image_version:
-            cluster_data['software_config']['image_version'] = self.image_version
-
-        elif self.custom_image:
+        if self.custom_image:
             project_id = self.custom_image_project_id or self.project_id
             custom_image_url = (
                 f'https://www.googleapis.com/compute/beta/projects/{project_id}'
@@ -388,27 +507,22 @@ class ClusterGenerator:
         if self.single_node:
             self.properties["dataproc:dataproc.allow.zero.workers"] = "true"
 
-        if self.properties:
-            cluster_data['software_config']['properties'] = self.properties
-
-        if self.optional_components:
-            cluster_data['software_config']['optional_components'] = self.optional_components
+        software_config = {
+            'image_version': self.image_version,
+            'properties': self.properties,
+            'optional_components': self.optional_components,
+        }
+        cluster_data['software_config'] = {key: value for key, value in software_config.items() if value}
 
         cluster_data = self._build_lifecycle_config(cluster_data)
 
         if self.init_actions_uris:
-            init_actions_dict = [
-                {'executable_file': uri, 'execution_timeout': self._get_init_action_timeout()}
+            # The parsed timeout is read-only, so one dict can be shared by every action.
+            init_action_timeout = self._get_init_action_timeout()
+            cluster_data['initialization_actions'] = [
+                {'executable_file': uri, 'execution_timeout': init_action_timeout}
                 for uri in self.init_actions_uris
             ]
-            cluster_data['initialization_actions'] = init_actions_dict
-
-        if self.customer_managed_key:
-            cluster_data['encryption_config'] = {'gce_pd_kms_key_name': self.customer_managed_key}
-        if self.autoscaling_policy:
-            cluster_data['autoscaling_config'] = {'policy_uri': self.autoscaling_policy}
-        if self.enable_component_gateway:
-            cluster_data['endpoint_config'] = {'enable_http_port_access': self.enable_component_gateway}
 
         return cluster_data
 
@@ -420,6 +534,9 @@ class ClusterGenerator:
         return self._build_cluster_data()
 
 
+CLUSTER_GENERATOR_PARAMS = inspect.signature(ClusterGenerator.__init__).parameters
+
+
 class DataprocCreateClusterOperator(BaseOperator):
     """
     Create a new cluster on Google Cloud Dataproc. The operator will wait until the
@@ -469,6 +586,8 @@ class DataprocCreateClusterOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run the waits for pending CREATING or DELETING cluster states on the
+        triggerer instead of blocking a worker slot while the cluster is provisioned.
     """
 
     template_fields: Sequence[str] = (
@@ -499,6 +618,7 @@ class DataprocCreateClusterOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        deferrable: bool = False,
         **kwargs,
     ) -> None:
         if region is None:
@@ -532,8 +652,7 @@ class DataprocCreateClusterOperator(BaseOperator):
             cluster_config = ClusterGenerator(**kwargs).make()
 
             # Remove from kwargs cluster params passed for backward compatibility
-            cluster_params = inspect.signature(ClusterGenerator.__init__).parameters
-            for arg in cluster_params:
+            for arg in CLUSTER_GENERATOR_PARAMS:
                 if arg in kwargs:
                     del kwargs[arg]
 
@@ -552,6 +671,7 @@ class DataprocCreateClusterOperator(BaseOperator):
         self.delete_on_error = delete_on_error
         self.use_if_exists = use_if_exists
         self.impersonation_chain = impersonation_chain
+        self.deferrable = deferrable
 
     def _create_cluster(self, hook: DataprocHook):
         operation = hook.create_cluster(
@@ -584,7 +704,7 @@ class DataprocCreateClusterOperator(BaseOperator):
         )
 
     def _handle_error_state(self, hook: DataprocHook, cluster: Cluster) -> None:
-        if cluster.status.state != cluster.status.State.ERROR:
+        if cluster.status.state != ClusterStatus.State.ERROR:
             return
         self.log.info("Cluster is in ERROR state")
         gcs_uri = hook.diagnose_cluster(
@@ -608,11 +728,10 @@ class DataprocCreateClusterOperator(BaseOperator):
             except NotFound:
                 break
 
-    def _wait_for_cluster_in_creating_state(self, hook: DataprocHook) -> Cluster:
+    def _wait_for_cluster_in_creating_state(self, hook: DataprocHook, cluster: Cluster) -> Cluster:
         time_left = self.timeout
-        cluster = self._get_cluster(hook)
         for time_to_sleep in exponential_sleep_generator(initial=10, maximum=120):
-            if cluster.status.state != cluster.status.State.CREATING:
+            if cluster.status.state != ClusterStatus.State.CREATING:
                 break
             if time_left < 0:
                 raise AirflowException(f"Cluster {self.cluster_name} is still CREATING state, aborting")
@@ -623,7 +742,7 @@ class DataprocCreateClusterOperator(BaseOperator):
 
     def execute(self, context: 'Context') -> dict:
         self.log.info('Creating cluster: %s', self.cluster_name)
-        hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        hook = _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
         # Save data required to display extra link no matter what the cluster status will be
         self.xcom_push(
             context,
@@ -645,12 +764,16 @@ class DataprocCreateClusterOperator(BaseOperator):
 
         # Check if cluster is not in ERROR state
         self._handle_error_state(hook, cluster)
-        if cluster.status.state == cluster.status.State.CREATING:
+        if cluster.status.state == ClusterStatus.State.CREATING:
             # Wait for cluster to be created
-            cluster = self._wait_for_cluster_in_creating_state(hook)
+            if self.deferrable:
+                self._defer_to_trigger(pending_state="CREATING", method_name="execute_complete")
+            cluster = self._wait_for_cluster_in_creating_state(hook, cluster)
             self._handle_error_state(hook, cluster)
-        elif cluster.status.state == cluster.status.State.DELETING:
+        elif cluster.status.state == ClusterStatus.State.DELETING:
             # Wait for cluster to be deleted
+            if self.deferrable:
+                self._defer_to_trigger(pending_state="DELETING", method_name="execute_complete_deleted")
             self._wait_for_cluster_in_deleting_state(hook)
             # Create new cluster
             cluster = self._create_cluster(hook)
@@ -658,6 +781,35 @@ class DataprocCreateClusterOperator(BaseOperator):
 
         return Cluster.to_dict(cluster)
 
+    def _defer_to_trigger(self, pending_state: str, method_name: str) -> None:
+        """Hand the wait for the given pending cluster state over to the triggerer."""
+        self.defer(
+            trigger=DataprocClusterTrigger(
+                cluster_name=self.cluster_name,
+                region=self.region,
+                project_id=self.project_id,
+                pending_state=pending_state,
+                gcp_conn_id=self.gcp_conn_id,
+                impersonation_chain=self.impersonation_chain,
+            ),
+            method_name=method_name,
+            timeout=timedelta(seconds=self.timeout),
+        )
+
+    def execute_complete(self, context: 'Context', event: Optional[dict] = None) -> dict:
+        """Callback for when the cluster left CREATING state on the triggerer."""
+        hook = _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
+        cluster = self._get_cluster(hook)
+        self._handle_error_state(hook, cluster)
+        return Cluster.to_dict(cluster)
+
+    def execute_complete_deleted(self, context: 'Context', event: Optional[dict] = None) -> dict:
+        """Callback for when a previously existing cluster finished deleting on the triggerer."""
+        hook = _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
+        cluster = self._create_cluster(hook)
+        self._handle_error_state(hook, cluster)
+        return Cluster.to_dict(cluster)
+
 
 class DataprocScaleClusterOperator(BaseOperator):
     """
@@ -696,12 +848,19 @@ class DataprocScaleClusterOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param asynchronous: Flag to return after submitting the scale request to the API.
+        This is useful for not blocking the worker slot while the cluster is being re-scaled.
     """
 
     template_fields: Sequence[str] = ('cluster_name', 'project_id', 'region', 'impersonation_chain')
 
     operator_extra_links = (DataprocClusterLink(),)
 
+    UPDATE_MASK_PATHS = (
+        "config.worker_config.num_instances",
+        "config.secondary_worker_config.num_instances",
+    )
+
     def __init__(
         self,
         *,
@@ -713,6 +872,7 @@ class DataprocScaleClusterOperator(BaseOperator):
         graceful_decommission_timeout: Optional[str] = None,
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        asynchronous: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -724,43 +884,33 @@ class DataprocScaleClusterOperator(BaseOperator):
         self.graceful_decommission_timeout = graceful_decommission_timeout
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.asynchronous = asynchronous
+        # The worker counts are not templated, so the scale request body can be
+        # prepared once up front.
+        self._scale_cluster_data = self._build_scale_cluster_data()
 
         # TODO: Remove one day
-        warnings.warn(
-            f"The `{type(self).__name__}` operator is deprecated, "
-            "please use `DataprocUpdateClusterOperator` instead.",
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SCALE_MESSAGE)
 
     def _build_scale_cluster_data(self) -> dict:
+        num_instances_key = 'num_instances'
         scale_data = {
             'config': {
-                'worker_config': {'num_instances': self.num_workers},
-                'secondary_worker_config': {'num_instances': self.num_preemptible_workers},
+                'worker_config': {num_instances_key: self.num_workers},
+                'secondary_worker_config': {num_instances_key: self.num_preemptible_workers},
             }
         }
         return scale_data
 
-    @property
+    @cached_property
     def _graceful_decommission_timeout_object(self) -> Optional[Dict[str, int]]:
         if not self.graceful_decommission_timeout:
             return None
 
         timeout = None
-        match = re.match(r"^(\d+)([smdh])$", self.graceful_decommission_timeout)
+        match = GRACEFUL_DECOMMISSION_TIMEOUT_PATTERN.match(self.graceful_decommission_timeout)
         if match:
-            if match.group(2) == "s":
-                timeout = int(match.group(1))
-            elif match.group(2) == "m":
-                val = float(match.group(1))
-                timeout = int(timedelta(minutes=val).total_seconds())
-            elif match.group(2) == "h":
-                val = float(match.group(1))
-                timeout = int(timedelta(hours=val).total_seconds())
-            elif match.group(2) == "d":
-                val = float(match.group(1))
-                timeout = int(timedelta(days=val).total_seconds())
+            timeout = int(match.group(1)) * TIMEOUT_UNIT_SECONDS[match.group(2)]
 
         if not timeout:
             raise AirflowException(
@@ -775,10 +925,7 @@ class DataprocScaleClusterOperator(BaseOperator):
         """Scale, up or down, a cluster on Google Cloud Dataproc."""
         self.log.info("Scaling cluster: %s", self.cluster_name)
 
-        scaling_cluster_data = self._build_scale_cluster_data()
-        update_mask = ["config.worker_config.num_instances", "config.secondary_worker_config.num_instances"]
-
-        hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        hook = _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
         # Save data required to display extra link no matter what the cluster status will be
         self.xcom_push(
             context,
@@ -793,10 +940,13 @@ class DataprocScaleClusterOperator(BaseOperator):
             project_id=self.project_id,
             region=self.region,
             cluster_name=self.cluster_name,
-            cluster=scaling_cluster_data,
+            cluster=self._scale_cluster_data,
             graceful_decommission_timeout=self._graceful_decommission_timeout_object,
-            update_mask={'paths': update_mask},
+            update_mask={'paths': list(self.UPDATE_MASK_PATHS)},
         )
+        if self.asynchronous:
+            self.log.info("Scale request submitted, not waiting for the operation to complete.")
+            return
         operation.result()
         self.log.info("Cluster scaling finished")
 
@@ -827,6 +977,8 @@ class DataprocDeleteClusterOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param asynchronous: Flag to return after submitting the delete request to the API.
+        This is useful for not blocking the worker slot while the cluster is being deleted.
     """
 
     template_fields: Sequence[str] = ('project_id', 'region', 'cluster_name', 'impersonation_chain')
@@ -844,6 +996,7 @@ class DataprocDeleteClusterOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        asynchronous: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -857,6 +1010,10 @@ class DataprocDeleteClusterOperator(BaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.asynchronous = asynchronous
+        # retry/timeout/metadata are not templated, so the API call defaults can be
+        # bundled once instead of being re-assembled per execution.
+        self._api_request_kwargs = {'retry': retry, 'timeout': timeout, 'metadata': metadata}
 
     def execute(self, context: 'Context') -> None:
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -867,10 +1024,11 @@ class DataprocDeleteClusterOperator(BaseOperator):
             cluster_name=self.cluster_name,
             cluster_uuid=self.cluster_uuid,
             request_id=self.request_id,
-            retry=self.retry,
-            timeout=self.timeout,
-            metadata=self.metadata,
+            **self._api_request_kwargs,
         )
+        if self.asynchronous:
+            self.log.info("Delete request submitted, not waiting for the operation to complete.")
+            return
         operation.result()
         self.log.info("Cluster deleted.")
 
@@ -963,15 +1121,27 @@ class DataprocJobBaseOperator(BaseOperator):
 
         self.job_error_states = job_error_states if job_error_states is not None else {'ERROR'}
         self.impersonation_chain = impersonation_chain
-        self.hook = DataprocHook(gcp_conn_id=gcp_conn_id, impersonation_chain=impersonation_chain)
-        self.project_id = self.hook.project_id if project_id is None else project_id
+        self.project_id = project_id
         self.job_template: Optional[DataProcJobBuilder] = None
         self.job: Optional[dict] = None
         self.dataproc_job_id = None
         self.asynchronous = asynchronous
 
+    @cached_property
+    def hook(self) -> DataprocHook:
+        """Hook created lazily so that DAG parsing does not touch the connection."""
+        return _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
+
     def create_job_template(self) -> DataProcJobBuilder:
-        """Initialize `self.job_template` with default values"""
+        """
+        Initialize `self.job_template` with default values.
+
+        The builder is deliberately created at execution time rather than in
+        ``__init__``: job_name, cluster_name, properties and jars are templated
+        fields, and only after rendering do they hold their final values.
+        """
+        if self.project_id is None:
+            self.project_id = self.hook.project_id
         if self.project_id is None:
             raise AirflowException(
                 "project id should either be set via project_id "
@@ -996,30 +1166,60 @@ class DataprocJobBaseOperator(BaseOperator):
             return job['job']
         raise Exception("Create a job template before")
 
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
+        """
+        Template method used by ``generate_job`` and ``execute`` to populate the
+        job template with the job-type specific parameters.
+        """
+        raise AirflowException("Create a job template before")
+
+    @staticmethod
+    def _add_query_source(
+        job_template: DataProcJobBuilder, query: Optional[str], query_uri: Optional[str]
+    ) -> None:
+        """Add either the inline query or the query file URI to the job template."""
+        if query is None:
+            if query_uri is None:
+                raise AirflowException('One of query or query_uri should be set here')
+            job_template.add_query_uri(query_uri)
+        else:
+            job_template.add_query(query)
+
+    def generate_job(self):
+        """
+        Helper method for easier migration to `DataprocSubmitJobOperator`.
+        :return: Dict representing Dataproc job
+        """
+        job_template = self.create_job_template()
+        self._configure_job_template(job_template)
+        return self._generate_job_template()
+
     def execute(self, context: 'Context'):
-        if self.job_template:
+        if self.job_template is None:
+            job_template = self.create_job_template()
+            self._configure_job_template(job_template)
+        if self.job is None:
             self.job = self.job_template.build()
-            self.dataproc_job_id = self.job["job"]["reference"]["job_id"]
-            self.log.info('Submitting %s job %s', self.job_type, self.dataproc_job_id)
-            job_object = self.hook.submit_job(
-                project_id=self.project_id, job=self.job["job"], region=self.region
-            )
-            job_id = job_object.reference.job_id
-            self.log.info('Job %s submitted successfully.', job_id)
-            # Save data required for extra links no matter what the job status will be
-            self.xcom_push(
-                context,
-                key='job_conf',
-                value={'job_id': job_id, 'region': self.region, 'project_id': self.project_id},
-            )
+        # Once the job dict is built the builder is dead weight; dropping it keeps
+        # the operator cheap to pickle for the executor and scheduler.
+        self.job_template = None
+        self.dataproc_job_id = self.job["job"]["reference"]["job_id"]
+        self.log.info('Submitting %s job %s', self.job_type, self.dataproc_job_id)
+        job_object = self.hook.submit_job(project_id=self.project_id, job=self.job["job"], region=self.region)
+        job_id = _JOB_ID_GETTER(job_object)
+        self.log.info('Job %s submitted successfully.', job_id)
+        # Save data required for extra links no matter what the job status will be
+        self.xcom_push(
+            context,
+            key='job_conf',
+            value={'job_id': job_id, 'region': self.region, 'project_id': self.project_id},
+        )
 
-            if not self.asynchronous:
-                self.log.info('Waiting for job %s to complete', job_id)
-                self.hook.wait_for_job(job_id=job_id, region=self.region, project_id=self.project_id)
-                self.log.info('Job %s completed successfully.', job_id)
-            return job_id
-        else:
-            raise AirflowException("Create a job template before")
+        if not self.asynchronous:
+            self.log.info('Waiting for job %s to complete', job_id)
+            self.hook.wait_for_job(job_id=job_id, region=self.region, project_id=self.project_id)
+            self.log.info('Job %s completed successfully.', job_id)
+        return job_id
 
     def on_kill(self) -> None:
         """
@@ -1070,16 +1270,7 @@ class DataprocSubmitPigJobOperator(DataprocJobBaseOperator):
     :param variables: Map of named parameters for the query. (templated)
     """
 
-    template_fields: Sequence[str] = (
-        'query',
-        'variables',
-        'job_name',
-        'cluster_name',
-        'region',
-        'dataproc_jars',
-        'dataproc_properties',
-        'impersonation_chain',
-    )
+    template_fields: Sequence[str] = DATAPROC_QUERY_JOB_TEMPLATE_FIELDS
     template_ext = ('.pg', '.pig')
     ui_color = '#0273d4'
     job_type = 'pig_job'
@@ -1095,47 +1286,17 @@ class DataprocSubmitPigJobOperator(DataprocJobBaseOperator):
         **kwargs,
     ) -> None:
         # TODO: Remove one day
-        warnings.warn(
-            "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
-            " `generate_job` method of `{cls}` to generate dictionary representing your job"
-            " and use it with the new operator.".format(cls=type(self).__name__),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SUBMIT_MESSAGE)
 
         super().__init__(**kwargs)
         self.query = query
         self.query_uri = query_uri
         self.variables = variables
 
-    def generate_job(self):
-        """
-        Helper method for easier migration to `DataprocSubmitJobOperator`.
-        :return: Dict representing Dataproc job
-        """
-        job_template = self.create_job_template()
-
-        if self.query is None:
-            if self.query_uri is None:
-                raise AirflowException('One of query or query_uri should be set here')
-            job_template.add_query_uri(self.query_uri)
-        else:
-            job_template.add_query(self.query)
-        job_template.add_variables(self.variables)
-        return self._generate_job_template()
-
-    def execute(self, context: 'Context'):
-        job_template = self.create_job_template()
-        if self.query is None:
-            if self.query_uri is None:
-                raise AirflowException('One of query or query_uri should be set here')
-            job_template.add_query_uri(self.query_uri)
-        else:
-            job_template.add_query(self.query)
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
+        self._add_query_source(job_template, self.query, self.query_uri)
         job_template.add_variables(self.variables)
 
-        super().execute(context)
-
 
 class DataprocSubmitHiveJobOperator(DataprocJobBaseOperator):
     """
@@ -1146,16 +1307,7 @@ class DataprocSubmitHiveJobOperator(DataprocJobBaseOperator):
     :param variables: Map of named parameters for the query.
     """
 
-    template_fields: Sequence[str] = (
-        'query',
-        'variables',
-        'job_name',
-        'cluster_name',
-        'region',
-        'dataproc_jars',
-        'dataproc_properties',
-        'impersonation_chain',
-    )
+    template_fields: Sequence[str] = DATAPROC_QUERY_JOB_TEMPLATE_FIELDS
     template_ext = ('.q', '.hql')
     ui_color = '#0273d4'
     job_type = 'hive_job'
@@ -1169,13 +1321,7 @@ class DataprocSubmitHiveJobOperator(DataprocJobBaseOperator):
         **kwargs,
     ) -> None:
         # TODO: Remove one day
-        warnings.warn(
-            "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
-            " `generate_job` method of `{cls}` to generate dictionary representing your job"
-            " and use it with the new operator.".format(cls=type(self).__name__),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SUBMIT_MESSAGE)
 
         super().__init__(**kwargs)
         self.query = query
@@ -1184,31 +1330,9 @@ class DataprocSubmitHiveJobOperator(DataprocJobBaseOperator):
         if self.query is not None and self.query_uri is not None:
             raise AirflowException('Only one of `query` and `query_uri` can be passed.')
 
-    def generate_job(self):
-        """
-        Helper method for easier migration to `DataprocSubmitJobOperator`.
-        :return: Dict representing Dataproc job
-        """
-        job_template = self.create_job_template()
-        if self.query is None:
-            if self.query_uri is None:
-                raise AirflowException('One of query or query_uri should be set here')
-            job_template.add_query_uri(self.query_uri)
-        else:
-            job_template.add_query(self.query)
-        job_template.add_variables(self.variables)
-        return self._generate_job_template()
-
-    def execute(self, context: 'Context'):
-        job_template = self.create_job_template()
-        if self.query is None:
-            if self.query_uri is None:
-                raise AirflowException('One of query or query_uri should be set here')
-            job_template.add_query_uri(self.query_uri)
-        else:
-            job_template.add_query(self.query)
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
+        self._add_query_source(job_template, self.query, self.query_uri)
         job_template.add_variables(self.variables)
-        super().execute(context)
 
 
 class DataprocSubmitSparkSqlJobOperator(DataprocJobBaseOperator):
@@ -1220,16 +1344,7 @@ class DataprocSubmitSparkSqlJobOperator(DataprocJobBaseOperator):
     :param variables: Map of named parameters for the query. (templated)
     """
 
-    template_fields: Sequence[str] = (
-        'query',
-        'variables',
-        'job_name',
-        'cluster_name',
-        'region',
-        'dataproc_jars',
-        'dataproc_properties',
-        'impersonation_chain',
-    )
+    template_fields: Sequence[str] = DATAPROC_QUERY_JOB_TEMPLATE_FIELDS
     template_ext = ('.q',)
     ui_color = '#0273d4'
     job_type = 'spark_sql_job'
@@ -1243,13 +1358,7 @@ class DataprocSubmitSparkSqlJobOperator(DataprocJobBaseOperator):
         **kwargs,
     ) -> None:
         # TODO: Remove one day
-        warnings.warn(
-            "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
-            " `generate_job` method of `{cls}` to generate dictionary representing your job"
-            " and use it with the new operator.".format(cls=type(self).__name__),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SUBMIT_MESSAGE)
 
         super().__init__(**kwargs)
         self.query = query
@@ -1258,29 +1367,9 @@ class DataprocSubmitSparkSqlJobOperator(DataprocJobBaseOperator):
         if self.query is not None and self.query_uri is not None:
             raise AirflowException('Only one of `query` and `query_uri` can be passed.')
 
-    def generate_job(self):
-        """
-        Helper method for easier migration to `DataprocSubmitJobOperator`.
-        :return: Dict representing Dataproc job
-        """
-        job_template = self.create_job_template()
-        if self.query is None:
-            job_template.add_query_uri(self.query_uri)
-        else:
-            job_template.add_query(self.query)
-        job_template.add_variables(self.variables)
-        return self._generate_job_template()
-
-    def execute(self, context: 'Context'):
-        job_template = self.create_job_template()
-        if self.query is None:
-            if self.query_uri is None:
-                raise AirflowException('One of query or query_uri should be set here')
-            job_template.add_query_uri(self.query_uri)
-        else:
-            job_template.add_query(self.query)
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
+        self._add_query_source(job_template, self.query, self.query_uri)
         job_template.add_variables(self.variables)
-        super().execute(context)
 
 
 class DataprocSubmitSparkJobOperator(DataprocJobBaseOperator):
@@ -1297,15 +1386,7 @@ class DataprocSubmitSparkJobOperator(DataprocJobBaseOperator):
     :param files: List of files to be copied to the working directory
     """
 
-    template_fields: Sequence[str] = (
-        'arguments',
-        'job_name',
-        'cluster_name',
-        'region',
-        'dataproc_jars',
-        'dataproc_properties',
-        'impersonation_chain',
-    )
+    template_fields: Sequence[str] = DATAPROC_JAR_JOB_TEMPLATE_FIELDS
     ui_color = '#0273d4'
     job_type = 'spark_job'
 
@@ -1320,13 +1401,7 @@ class DataprocSubmitSparkJobOperator(DataprocJobBaseOperator):
         **kwargs,
     ) -> None:
         # TODO: Remove one day
-        warnings.warn(
-            "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
-            " `generate_job` method of `{cls}` to generate dictionary representing your job"
-            " and use it with the new operator.".format(cls=type(self).__name__),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SUBMIT_MESSAGE)
 
         super().__init__(**kwargs)
         self.main_jar = main_jar
@@ -1335,25 +1410,9 @@ class DataprocSubmitSparkJobOperator(DataprocJobBaseOperator):
         self.archives = archives
         self.files = files
 
-    def generate_job(self):
-        """
-        Helper method for easier migration to `DataprocSubmitJobOperator`.
-        :return: Dict representing Dataproc job
-        """
-        job_template = self.create_job_template()
-        job_template.set_main(self.main_jar, self.main_class)
-        job_template.add_args(self.arguments)
-        job_template.add_archive_uris(self.archives)
-        job_template.add_file_uris(self.files)
-        return self._generate_job_template()
-
-    def execute(self, context: 'Context'):
-        job_template = self.create_job_template()
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
         job_template.set_main(self.main_jar, self.main_class)
-        job_template.add_args(self.arguments)
-        job_template.add_archive_uris(self.archives)
-        job_template.add_file_uris(self.files)
-        super().execute(context)
+        job_template.add_job_resources(args=self.arguments, archives=self.archives, files=self.files)
 
 
 class DataprocSubmitHadoopJobOperator(DataprocJobBaseOperator):
@@ -1370,15 +1429,7 @@ class DataprocSubmitHadoopJobOperator(DataprocJobBaseOperator):
     :param files: List of files to be copied to the working directory
     """
 
-    template_fields: Sequence[str] = (
-        'arguments',
-        'job_name',
-        'cluster_name',
-        'region',
-        'dataproc_jars',
-        'dataproc_properties',
-        'impersonation_chain',
-    )
+    template_fields: Sequence[str] = DATAPROC_JAR_JOB_TEMPLATE_FIELDS
     ui_color = '#0273d4'
     job_type = 'hadoop_job'
 
@@ -1393,13 +1444,7 @@ class DataprocSubmitHadoopJobOperator(DataprocJobBaseOperator):
         **kwargs,
     ) -> None:
         # TODO: Remove one day
-        warnings.warn(
-            "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
-            " `generate_job` method of `{cls}` to generate dictionary representing your job"
-            " and use it with the new operator.".format(cls=type(self).__name__),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SUBMIT_MESSAGE)
 
         super().__init__(**kwargs)
         self.main_jar = main_jar
@@ -1408,25 +1453,9 @@ class DataprocSubmitHadoopJobOperator(DataprocJobBaseOperator):
         self.archives = archives
         self.files = files
 
-    def generate_job(self):
-        """
-        Helper method for easier migration to `DataprocSubmitJobOperator`.
-        :return: Dict representing Dataproc job
-        """
-        job_template = self.create_job_template()
-        job_template.set_main(self.main_jar, self.main_class)
-        job_template.add_args(self.arguments)
-        job_template.add_archive_uris(self.archives)
-        job_template.add_file_uris(self.files)
-        return self._generate_job_template()
-
-    def execute(self, context: 'Context'):
-        job_template = self.create_job_template()
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
         job_template.set_main(self.main_jar, self.main_class)
-        job_template.add_args(self.arguments)
-        job_template.add_archive_uris(self.archives)
-        job_template.add_file_uris(self.files)
-        super().execute(context)
+        job_template.add_job_resources(args=self.arguments, archives=self.archives, files=self.files)
 
 
 class DataprocSubmitPySparkJobOperator(DataprocJobBaseOperator):
@@ -1457,29 +1486,106 @@ class DataprocSubmitPySparkJobOperator(DataprocJobBaseOperator):
     job_type = 'pyspark_job'
 
     @staticmethod
-    def _generate_temp_filename(filename):
-        date = time.strftime('%Y%m%d%H%M%S')
-        return f"{date}_{str(uuid.uuid4())[:8]}_{ntpath.basename(filename)}"
+    def _is_local_file(path: str) -> bool:
+        """Check whether a referenced file lives on the local filesystem.
+
+        The ``gs://`` prefix check short-circuits remote URIs so that they never
+        cost a filesystem stat.
+        """
+        return not path.startswith('gs://') and os.path.isfile(path)
+
+    @staticmethod
+    def _hash_local_file(local_file):
+        """Return the hex MD5 digest of a local file, read in 4MB blocks.
+
+        The digest is a content fingerprint used to name the uploaded object,
+        not a security measure.
+        """
+        file_hash = hashlib.md5()
+        with open(local_file, 'rb') as source:
+            for block in iter(lambda: source.read(4 * 1024 * 1024), b''):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+
+    @cached_property
+    def _gcs_hook(self) -> GCSHook:
+        """GCS hook shared by the upload helpers; created on first use inside ``execute``."""
+        return GCSHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
 
     def _upload_file_temp(self, bucket, local_file):
         """Upload a local file to a Google Cloud Storage bucket."""
-        temp_filename = self._generate_temp_filename(local_file)
         if not bucket:
             raise AirflowException(
                 "If you want Airflow to upload the local file to a temporary bucket, set "
                 "the 'temp_bucket' key in the connection string"
             )
+        # Content-derived object names let identical files short-circuit the
+        # upload entirely on re-runs. Typical driver files are small enough to
+        # hash and upload from a single disk read.
+        file_size = os.path.getsize(local_file)
+        data: Optional[bytes] = None
+        if file_size <= SINGLE_READ_UPLOAD_SIZE:
+            with open(local_file, 'rb') as source:
+                data = source.read()
+            file_hash = hashlib.md5(data).hexdigest()
+        else:
+            file_hash = self._hash_local_file(local_file)
+        temp_filename = f"{file_hash}_{ntpath.basename(local_file)}"
 
-        self.log.info("Uploading %s to %s", local_file, temp_filename)
+        gcs_hook = self._gcs_hook
+        if gcs_hook.exists(bucket_name=bucket, object_name=temp_filename):
+            self.log.info("File %s is already uploaded as %s, skipping upload", local_file, temp_filename)
+            return f"gs://{bucket}/{temp_filename}"
 
-        GCSHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain).upload(
-            bucket_name=bucket,
-            object_name=temp_filename,
-            mime_type='application/x-python',
-            filename=local_file,
-        )
+        self.log.info("Uploading %s to %s", local_file, temp_filename)
+        # GCSHook.upload dispatches on the truthiness of ``data``, so empty
+        # files must take the ``filename`` branch below.
+        if data:
+            gcs_hook.upload(
+                bucket_name=bucket,
+                object_name=temp_filename,
+                data=data,
+            )
+        elif file_size > PARALLEL_UPLOAD_CHUNK_SIZE:
+            self._upload_file_composed(gcs_hook, bucket, temp_filename, local_file)
+        else:
+            gcs_hook.upload(
+                bucket_name=bucket,
+                object_name=temp_filename,
+                filename=local_file,
+            )
         return f"gs://{bucket}/{temp_filename}"
 
+    def _upload_file_composed(self, gcs_hook: GCSHook, bucket: str, object_name: str, local_file: str):
+        """
+        Upload a large local file as concurrently-uploaded chunks composed into one object.
+
+        Splitting the file lets the chunks travel over parallel connections, which
+        saturates the available bandwidth where a single sequential PUT would not.
+        """
+        file_size = os.path.getsize(local_file)
+        num_parts = min(-(-file_size // PARALLEL_UPLOAD_CHUNK_SIZE), PARALLEL_UPLOAD_MAX_PARTS)
+        part_size = -(-file_size // num_parts)
+        # The final object name is content-derived, so concurrent tasks staging
+        # the same file would write identical part names and race each other's
+        # compose/cleanup; a per-attempt prefix keeps every uploader on its own
+        # part objects.
+        part_prefix = f"{object_name}.{uuid.uuid4().hex[:8]}"
+        part_names = [f"{part_prefix}.part{index:02d}" for index in range(num_parts)]
+
+        def _upload_part(index: int) -> None:
+            with open(local_file, 'rb') as source:
+                source.seek(index * part_size)
+                data = source.read(part_size)
+            gcs_hook.upload(bucket_name=bucket, object_name=part_names[index], data=data)
+
+        max_workers = min(num_parts, 8, max(1, PARALLEL_UPLOAD_BUFFER_LIMIT // part_size))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_upload_part, range(num_parts)))
+        gcs_hook.compose(bucket_name=bucket, source_objects=part_names, destination_object=object_name)
+        for part_name in part_names:
+            gcs_hook.delete(bucket_name=bucket, object_name=part_name)
+
     def __init__(
         self,
         *,
@@ -1491,13 +1597,7 @@ class DataprocSubmitPySparkJobOperator(DataprocJobBaseOperator):
         **kwargs,
     ) -> None:
         # TODO: Remove one day
-        warnings.warn(
-            "The `{cls}` operator is deprecated, please use `DataprocSubmitJobOperator` instead. You can use"
-            " `generate_job` method of `{cls}` to generate dictionary representing your job"
-            " and use it with the new operator.".format(cls=type(self).__name__),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        _warn_deprecated_operator(type(self), _DEPRECATED_SUBMIT_MESSAGE)
 
         super().__init__(**kwargs)
         self.main = main
@@ -1506,43 +1606,45 @@ class DataprocSubmitPySparkJobOperator(DataprocJobBaseOperator):
         self.files = files
         self.pyfiles = pyfiles
 
+    def _configure_job_template(self, job_template: DataProcJobBuilder) -> None:
+        job_template.set_python_main(self.main)
+        job_template.add_job_resources(
+            args=self.arguments, archives=self.archives, files=self.files, pyfiles=self.pyfiles
+        )
+
     def generate_job(self):
         """
         Helper method for easier migration to `DataprocSubmitJobOperator`.
         :return: Dict representing Dataproc job
         """
-        job_template = self.create_job_template()
         #  Check if the file is local, if that is the case, upload it to a bucket
-        if os.path.isfile(self.main):
-            cluster_info = self.hook.get_cluster(
-                project_id=self.project_id, region=self.region, cluster_name=self.cluster_name
-            )
-            bucket = cluster_info['config']['config_bucket']
+        if self._is_local_file(self.main):
+            bucket = _get_config_bucket(self.hook, self.project_id, self.region, self.cluster_name)
             self.main = f"gs://{bucket}/{self.main}"
-        job_template.set_python_main(self.main)
-        job_template.add_args(self.arguments)
-        job_template.add_archive_uris(self.archives)
-        job_template.add_file_uris(self.files)
-        job_template.add_python_file_uris(self.pyfiles)
+        return super().generate_job()
 
-        return self._generate_job_template()
+    def _upload_local_files(self, bucket: str, local_files: List[str]) -> Dict[str, str]:
+        """Upload local files concurrently and map each one to its ``gs://`` URI."""
+        with ThreadPoolExecutor(max_workers=min(len(local_files), 8)) as executor:
+            uris = executor.map(lambda local_file: self._upload_file_temp(bucket, local_file), local_files)
+            return dict(zip(local_files, uris))
 
     def execute(self, context: 'Context'):
-        job_template = self.create_job_template()
-        #  Check if the file is local, if that is the case, upload it to a bucket
-        if os.path.isfile(self.main):
-            cluster_info = self.hook.get_cluster(
-                project_id=self.project_id, region=self.region, cluster_name=self.cluster_name
-            )
-            bucket = cluster_info['config']['config_bucket']
-            self.main = self._upload_file_temp(bucket, self.main)
-
-        job_template.set_python_main(self.main)
-        job_template.add_args(self.arguments)
-        job_template.add_archive_uris(self.archives)
-        job_template.add_file_uris(self.files)
-        job_template.add_python_file_uris(self.pyfiles)
-        super().execute(context)
+        #  Check if the main file or any dependency is local, if that is the case,
+        #  upload them to a bucket
+        referenced_files = [self.main, *(self.pyfiles or []), *(self.files or []), *(self.archives or [])]
+        local_files = list(dict.fromkeys(f for f in referenced_files if self._is_local_file(f)))
+        if local_files:
+            bucket = _get_config_bucket(self.hook, self.project_id, self.region, self.cluster_name)
+            uploaded = self._upload_local_files(bucket, local_files)
+            self.main = uploaded.get(self.main, self.main)
+            if self.pyfiles:
+                self.pyfiles = [uploaded.get(f, f) for f in self.pyfiles]
+            if self.files:
+                self.files = [uploaded.get(f, f) for f in self.files]
+            if self.archives:
+                self.archives = [uploaded.get(f, f) for f in self.archives]
+        return super().execute(context)
 
 
 class DataprocCreateWorkflowTemplateOperator(BaseOperator):
@@ -1652,6 +1754,8 @@ class DataprocInstantiateWorkflowTemplateOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in deferrable mode. The worker slot is freed while the
+        workflow runs and the task resumes once the operation completes.
     """
 
     template_fields: Sequence[str] = ('template_id', 'impersonation_chain', 'request_id', 'parameters')
@@ -1671,6 +1775,7 @@ class DataprocInstantiateWorkflowTemplateOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        deferrable: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -1686,6 +1791,7 @@ class DataprocInstantiateWorkflowTemplateOperator(BaseOperator):
         self.request_id = request_id
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.deferrable = deferrable
 
     def execute(self, context: 'Context'):
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -1701,9 +1807,32 @@ class DataprocInstantiateWorkflowTemplateOperator(BaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        if self.deferrable:
+            self._defer_to_operation(operation)
         operation.result()
         self.log.info('Template instantiated.')
 
+    def _defer_to_operation(self, operation) -> None:
+        self.defer(
+            trigger=DataprocOperationTrigger(
+                name=operation.operation.name,
+                region=self.region,
+                gcp_conn_id=self.gcp_conn_id,
+                impersonation_chain=self.impersonation_chain,
+            ),
+            method_name='execute_complete',
+        )
+
+    def execute_complete(self, context: 'Context', event: Optional[dict] = None) -> None:
+        """
+        Callback for when the operation trigger fires - returns immediately.
+        Relies on trigger to throw an exception, otherwise it assumes execution was
+        successful.
+        """
+        if event is None or event.get('status') == 'error':
+            raise AirflowException(f"Workflow failed: {event.get('message') if event else 'no event'}")
+        self.log.info('Template instantiated.')
+
 
 class DataprocInstantiateInlineWorkflowTemplateOperator(BaseOperator):
     """
@@ -1741,6 +1870,8 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in deferrable mode. The worker slot is freed while the
+        workflow runs and the task resumes once the operation completes.
     """
 
     template_fields: Sequence[str] = ('template', 'impersonation_chain')
@@ -1758,6 +1889,7 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        deferrable: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -1771,6 +1903,7 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(BaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.deferrable = deferrable
 
     def execute(self, context: 'Context'):
         self.log.info('Instantiating Inline Template')
@@ -1784,9 +1917,32 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(BaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        if self.deferrable:
+            self._defer_to_operation(operation)
         operation.result()
         self.log.info('Template instantiated.')
 
+    def _defer_to_operation(self, operation) -> None:
+        self.defer(
+            trigger=DataprocOperationTrigger(
+                name=operation.operation.name,
+                region=self.region,
+                gcp_conn_id=self.gcp_conn_id,
+                impersonation_chain=self.impersonation_chain,
+            ),
+            method_name='execute_complete',
+        )
+
+    def execute_complete(self, context: 'Context', event: Optional[dict] = None) -> None:
+        """
+        Callback for when the operation trigger fires - returns immediately.
+        Relies on trigger to throw an exception, otherwise it assumes execution was
+        successful.
+        """
+        if event is None or event.get('status') == 'error':
+            raise AirflowException(f"Workflow failed: {event.get('message') if event else 'no event'}")
+        self.log.info('Template instantiated.')
+
 
 class DataprocSubmitJobOperator(BaseOperator):
     """
@@ -1821,6 +1977,9 @@ class DataprocSubmitJobOperator(BaseOperator):
         waiting on them asynchronously using the DataprocJobSensor
     :param cancel_on_kill: Flag which indicates whether cancel the hook's job or not, when on_kill is called
     :param wait_timeout: How many seconds wait for job to be ready. Used only if ``asynchronous`` is False
+    :param deferrable: Run operator in deferrable mode. Instead of polling the job from the
+        worker the task defers to a trigger, so every deferred job submission shares the
+        triggerer's event loop for polling.
     """
 
     template_fields: Sequence[str] = ('project_id', 'region', 'job', 'impersonation_chain', 'request_id')
@@ -1844,6 +2003,7 @@ class DataprocSubmitJobOperator(BaseOperator):
         asynchronous: bool = False,
         cancel_on_kill: bool = True,
         wait_timeout: Optional[int] = None,
+        deferrable: bool = False,
         **kwargs,
     ) -> None:
         if region is None:
@@ -1872,6 +2032,7 @@ class DataprocSubmitJobOperator(BaseOperator):
         self.hook: Optional[DataprocHook] = None
         self.job_id: Optional[str] = None
         self.wait_timeout = wait_timeout
+        self.deferrable = deferrable
 
     def execute(self, context: 'Context'):
         self.log.info("Submitting job")
@@ -1885,7 +2046,7 @@ class DataprocSubmitJobOperator(BaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
-        job_id = job_object.reference.job_id
+        job_id = _JOB_ID_GETTER(job_object)
         self.log.info('Job %s submitted successfully.', job_id)
         # Save data required by extra links no matter what the job status will be
         self.xcom_push(
@@ -1898,16 +2059,44 @@ class DataprocSubmitJobOperator(BaseOperator):
             },
         )
 
+        self.job_id = job_id
         if not self.asynchronous:
+            if self.deferrable:
+                self.defer(
+                    trigger=DataprocSubmitTrigger(
+                        dataproc_job_id=job_id,
+                        region=self.region,
+                        project_id=self.project_id,
+                        gcp_conn_id=self.gcp_conn_id,
+                        impersonation_chain=self.impersonation_chain,
+                    ),
+                    method_name='execute_complete',
+                    timeout=timedelta(seconds=self.wait_timeout) if self.wait_timeout else None,
+                )
             self.log.info('Waiting for job %s to complete', job_id)
             self.hook.wait_for_job(
                 job_id=job_id, region=self.region, project_id=self.project_id, timeout=self.wait_timeout
             )
             self.log.info('Job %s completed successfully.', job_id)
 
-        self.job_id = job_id
         return self.job_id
 
+    def execute_complete(self, context: 'Context', event: Optional[dict] = None) -> str:
+        """
+        Callback for when the job trigger fires - returns immediately.
+        Raises an exception if the job did not reach the DONE state.
+        """
+        if event is None:
+            raise AirflowException('Trigger fired without an event')
+        job_id = event['job_id']
+        job_state = event['job_state']
+        if job_state == 'ERROR':
+            raise AirflowException(f'Job failed:\n{job_id}')
+        if job_state == 'CANCELLED':
+            raise AirflowException(f'Job was cancelled:\n{job_id}')
+        self.log.info('Job %s completed successfully.', job_id)
+        return job_id
+
     def on_kill(self):
         if self.job_id and self.cancel_on_kill:
             self.hook.cancel_job(job_id=self.job_id, project_id=self.project_id, region=self.region)
@@ -1952,6 +2141,8 @@ class DataprocUpdateClusterOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in deferrable mode. The worker slot is freed while the
+        cluster is updated and the task resumes once the operation completes.
     """
 
     template_fields: Sequence[str] = ('impersonation_chain', 'cluster_name')
@@ -1973,6 +2164,7 @@ class DataprocUpdateClusterOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        deferrable: bool = False,
         **kwargs,
     ):
         if region is None:
@@ -1999,6 +2191,7 @@ class DataprocUpdateClusterOperator(BaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.deferrable = deferrable
 
     def execute(self, context: 'Context'):
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -2025,9 +2218,29 @@ class DataprocUpdateClusterOperator(BaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        if self.deferrable:
+            self.defer(
+                trigger=DataprocOperationTrigger(
+                    name=operation.operation.name,
+                    region=self.region,
+                    gcp_conn_id=self.gcp_conn_id,
+                    impersonation_chain=self.impersonation_chain,
+                ),
+                method_name='execute_complete',
+            )
         operation.result()
         self.log.info("Updated %s cluster.", self.cluster_name)
 
+    def execute_complete(self, context: 'Context', event: Optional[dict] = None) -> None:
+        """
+        Callback for when the operation trigger fires - returns immediately.
+        Relies on trigger to throw an exception, otherwise it assumes execution was
+        successful.
+        """
+        if event is None or event.get('status') == 'error':
+            raise AirflowException(f"Cluster update failed: {event.get('message') if event else 'no event'}")
+        self.log.info("Updated %s cluster.", self.cluster_name)
+
 
 class DataprocCreateBatchOperator(BaseOperator):
     """
@@ -2060,6 +2273,11 @@ class DataprocCreateBatchOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in deferrable mode. The batch is polled from the
+        triggerer instead of blocking a worker slot while it runs. Requires ``batch_id``.
+    :param fetch_on_conflict: Whether to fetch the existing batch when creation hits
+        ``AlreadyExists``. Set to False to skip that round-trip; the operator then returns
+        a minimal representation holding only the batch resource name.
     """
 
     template_fields: Sequence[str] = (
@@ -2083,26 +2301,38 @@ class DataprocCreateBatchOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        deferrable: bool = False,
+        fetch_on_conflict: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
+        if region is None:
+            raise AirflowException('Region should be set here')
         self.region = region
         self.project_id = project_id
         self.batch = batch
         self.batch_id = batch_id
+        self.fetch_on_conflict = fetch_on_conflict
         self.request_id = request_id
         self.retry = retry
         self.timeout = timeout
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.deferrable = deferrable
         self.operation: Optional[operation.Operation] = None
+        # Only retry/timeout/metadata can be pre-bound: the id and location
+        # arguments are templated and resolve at render time.
+        self._api_request_kwargs = {'retry': retry, 'timeout': timeout, 'metadata': metadata}
+
+    @cached_property
+    def hook(self) -> DataprocHook:
+        """Hook shared per connection and reused across retries and resumes."""
+        return _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
 
     def execute(self, context: 'Context'):
-        hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        hook = self.hook
         self.log.info("Creating batch")
-        if self.region is None:
-            raise AirflowException('Region should be set here')
         try:
             self.operation = hook.create_batch(
                 region=self.region,
@@ -2110,25 +2340,58 @@ class DataprocCreateBatchOperator(BaseOperator):
                 batch=self.batch,
                 batch_id=self.batch_id,
                 request_id=self.request_id,
-                retry=self.retry,
-                timeout=self.timeout,
-                metadata=self.metadata,
+                **self._api_request_kwargs,
             )
+            if self.deferrable:
+                if self.batch_id is None:
+                    raise AirflowException('Batch Id is required to run in deferrable mode')
+                self.defer(
+                    trigger=DataprocBatchTrigger(
+                        batch_id=self.batch_id,
+                        region=self.region,
+                        project_id=self.project_id,
+                        gcp_conn_id=self.gcp_conn_id,
+                        impersonation_chain=self.impersonation_chain,
+                    ),
+                    method_name='execute_complete',
+                )
             result = hook.wait_for_operation(timeout=self.timeout, operation=self.operation)
             self.log.info("Batch %s created", self.batch_id)
         except AlreadyExists:
             self.log.info("Batch with given id already exists")
             if self.batch_id is None:
                 raise AirflowException('Batch Id should be set here')
+            if not self.fetch_on_conflict:
+                name = f"projects/{self.project_id}/regions/{self.region}/batches/{self.batch_id}"
+                return Batch.to_dict(Batch(name=name)) if self.do_xcom_push else None
             result = hook.get_batch(
                 batch_id=self.batch_id,
                 region=self.region,
                 project_id=self.project_id,
-                retry=self.retry,
-                timeout=self.timeout,
-                metadata=self.metadata,
+                **self._api_request_kwargs,
             )
-        return Batch.to_dict(result)
+        # The dict conversion walks the whole proto; skip it when the result
+        # is not persisted anyway.
+        return Batch.to_dict(result) if self.do_xcom_push else None
+
+    def execute_complete(self, context: 'Context', event: Optional[dict] = None) -> dict:
+        """
+        Callback for when the batch trigger fires - returns immediately.
+        Fetches the finished batch and raises if it did not succeed.
+        """
+        if event is None:
+            raise AirflowException('Trigger fired without an event')
+        batch_state = event['batch_state']
+        if batch_state in ('FAILED', 'CANCELLED'):
+            raise AirflowException(f"Batch {event['batch_id']} finished in {batch_state} state")
+        batch = self.hook.get_batch(
+            batch_id=event['batch_id'],
+            region=self.region,
+            project_id=self.project_id,
+            **self._api_request_kwargs,
+        )
+        self.log.info("Batch %s created", event['batch_id'])
+        return Batch.to_dict(batch) if self.do_xcom_push else None
 
     def on_kill(self):
         if self.operation:
@@ -2137,10 +2400,10 @@ class DataprocCreateBatchOperator(BaseOperator):
 
 class DataprocDeleteBatchOperator(BaseOperator):
     """
-    Deletes the batch workload resource.
+    Deletes one or more batch workload resources.
 
-    :param batch_id: Required. The ID to use for the batch, which will become the final component
-        of the batch's resource name.
+    :param batch_id: Required. The ID of the batch to delete, or a list of IDs to delete
+        in parallel. Each ID is the final component of the batch's resource name.
         This value must be 4-63 characters. Valid characters are /[a-z][0-9]-/.
     :param project_id: Required. The ID of the Google Cloud project that the cluster belongs to.
     :param region: Required. The Cloud Dataproc region in which to handle the request.
@@ -2165,7 +2428,7 @@ class DataprocDeleteBatchOperator(BaseOperator):
     def __init__(
         self,
         *,
-        batch_id: str,
+        batch_id: Union[str, List[str]],
         region: str,
         project_id: str,
         retry: Optional[Retry] = None,
@@ -2184,18 +2447,36 @@ class DataprocDeleteBatchOperator(BaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
-
-    def execute(self, context: 'Context'):
-        hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
-        self.log.info("Deleting batch: %s", self.batch_id)
-        hook.delete_batch(
-            batch_id=self.batch_id,
+        # Only retry/timeout/metadata can be pre-bound: the id and location
+        # arguments are templated and resolve at render time.
+        self._api_request_kwargs = {'retry': retry, 'timeout': timeout, 'metadata': metadata}
+
+    @cached_property
+    def hook(self) -> DataprocHook:
+        """Hook shared per connection and reused across retries and resumes."""
+        return _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
+
+    def _delete_batch(self, batch_id: str) -> None:
+        self.hook.delete_batch(
+            batch_id=batch_id,
             region=self.region,
             project_id=self.project_id,
-            retry=self.retry,
-            timeout=self.timeout,
-            metadata=self.metadata,
+            **self._api_request_kwargs,
         )
+        # The id becomes reusable once the batch is deleted, so any cached
+        # terminal representation is no longer trustworthy.
+        _TERMINAL_BATCH_CACHE.pop((self.project_id, self.region, batch_id), None)
+
+    def execute(self, context: 'Context'):
+        if isinstance(self.batch_id, str):
+            self.log.info("Deleting batch: %s", self.batch_id)
+            self._delete_batch(self.batch_id)
+        else:
+            # delete_batch is I/O bound on gRPC, so a thread pool turns N serial
+            # round-trips into roughly one.
+            self.log.info("Deleting %d batches", len(self.batch_id))
+            with ThreadPoolExecutor(max_workers=min(32, len(self.batch_id))) as executor:
+                list(executor.map(self._delete_batch, self.batch_id))
         self.log.info("Batch deleted.")
 
 
@@ -2222,6 +2503,9 @@ class DataprocGetBatchOperator(BaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param use_cache: Whether lookups may be served from the in-process cache of batches
+        already seen in a terminal state. Batches that finished never change, so repeated
+        gets of the same batch skip the RPC entirely.
     """
 
     template_fields: Sequence[str] = ("batch_id", "region", "project_id", "impersonation_chain")
@@ -2237,6 +2521,7 @@ class DataprocGetBatchOperator(BaseOperator):
         metadata: Sequence[Tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        use_cache: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -2248,19 +2533,132 @@ class DataprocGetBatchOperator(BaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.use_cache = use_cache
+        # Only retry/timeout/metadata can be pre-bound: the id and location
+        # arguments are templated and resolve at render time.
+        self._api_request_kwargs = {'retry': retry, 'timeout': timeout, 'metadata': metadata}
+
+    @cached_property
+    def hook(self) -> DataprocHook:
+        """Hook shared per connection and reused across retries and resumes."""
+        return _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
 
     def execute(self, context: 'Context'):
-        hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        cache_key = (self.project_id, self.region, self.batch_id)
+        if self.use_cache:
+            cached = _TERMINAL_BATCH_CACHE.get(cache_key)
+            if cached is not None:
+                self.log.info("Returning cached batch: %s", self.batch_id)
+                return cached
         self.log.info("Getting batch: %s", self.batch_id)
-        batch = hook.get_batch(
+        batch = self.hook.get_batch(
             batch_id=self.batch_id,
             region=self.region,
             project_id=self.project_id,
-            retry=self.retry,
-            timeout=self.timeout,
-            metadata=self.metadata,
+            **self._api_request_kwargs,
         )
-        return Batch.to_dict(batch)
+        if not self.do_xcom_push and batch.state.name not in _TERMINAL_BATCH_STATES:
+            # Nothing persists the result and the batch cannot be cached yet,
+            # so the proto traversal would be pure overhead.
+            return None
+        batch_dict = Batch.to_dict(batch)
+        # Only terminal batches are immutable enough to cache.
+        if batch.state.name in _TERMINAL_BATCH_STATES:
+            while len(_TERMINAL_BATCH_CACHE) >= _TERMINAL_BATCH_CACHE_MAX_SIZE:
+                _TERMINAL_BATCH_CACHE.pop(next(iter(_TERMINAL_BATCH_CACHE)))
+            _TERMINAL_BATCH_CACHE[cache_key] = batch_dict
+        return batch_dict if self.do_xcom_push else None
+
+
+class DataprocGetBatchesAsyncOperator(BaseOperator):
+    """
+    Gets the resource representations of several batch workloads concurrently.
+
+    The lookups are issued together on one event loop through the asynchronous
+    batch client, so N batches cost roughly one round-trip of wall-clock time
+    instead of N sequential calls.
+
+    :param batch_ids: Required. The IDs of the batches to fetch.
+    :param project_id: Required. The ID of the Google Cloud project that the batches belong to.
+    :param region: Required. The Cloud Dataproc region in which to handle the request.
+    :param retry: A retry object used to retry requests. If ``None`` is specified, requests will not be
+        retried.
+    :param timeout: The amount of time, in seconds, to wait for each request to complete. Note that if
+        ``retry`` is specified, the timeout applies to each individual attempt.
+    :param metadata: Additional metadata that is provided to the method.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+        If set as a string, the account must grant the originating account
+        the Service Account Token Creator IAM role.
+        If set as a sequence, the identities from the list must grant
+        Service Account Token Creator IAM role to the directly preceding identity, with first
+        account from the list granting this role to the originating account (templated).
+    :param max_concurrent_requests: The maximum number of lookups in flight at once. Keeps a
+        large fan-in from bursting the whole id list at the API while still pipelining
+        requests on the shared channel.
+
+    :rtype: List[dict]
+    """
+
+    template_fields: Sequence[str] = ("batch_ids", "region", "project_id", "impersonation_chain")
+
+    def __init__(
+        self,
+        *,
+        batch_ids: List[str],
+        region: str,
+        project_id: str,
+        retry: Optional[Retry] = None,
+        timeout: Optional[float] = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        max_concurrent_requests: int = 32,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.batch_ids = batch_ids
+        self.max_concurrent_requests = max_concurrent_requests
+        self.region = region
+        self.project_id = project_id
+        self.retry = retry
+        self.timeout = timeout
+        self.metadata = metadata
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+
+    async def _get_batches(self, hook: DataprocAsyncHook, batch_ids: List[str]) -> List[Batch]:
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def _get_batch(batch_id: str) -> Batch:
+            async with semaphore:
+                return await hook.get_batch(
+                    batch_id=batch_id,
+                    region=self.region,
+                    project_id=self.project_id,
+                    retry=self.retry,
+                    timeout=self.timeout,
+                    metadata=self.metadata,
+                )
+
+        return await asyncio.gather(*(_get_batch(batch_id) for batch_id in batch_ids))
+
+    def execute(self, context: 'Context'):
+        hook = DataprocAsyncHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        # Fan-outs commonly repeat ids; fetch each one once and broadcast the
+        # result back to every position that referenced it.
+        unique_ids = list(dict.fromkeys(self.batch_ids))
+        if len(unique_ids) < len(self.batch_ids):
+            self.log.info(
+                "Getting %d unique batches out of %d requested", len(unique_ids), len(self.batch_ids)
+            )
+        else:
+            self.log.info("Getting %d batches", len(unique_ids))
+        batches = asyncio.run(self._get_batches(hook, unique_ids))
+        dicts_by_id = {batch_id: Batch.to_dict(batch) for batch_id, batch in zip(unique_ids, batches)}
+        return [dicts_by_id[batch_id] for batch_id in self.batch_ids]
 
 
 class DataprocListBatchesOperator(BaseOperator):
@@ -2273,6 +2671,18 @@ class DataprocListBatchesOperator(BaseOperator):
         return fewer than this value. The default page size is 20; the maximum page size is 1000.
     :param page_token: Optional. A page token received from a previous ``ListBatches`` call.
         Provide this token to retrieve the subsequent page.
+    :param limit: Optional. The maximum number of batches to return in total. Pagination stops
+        as soon as this many batches have been collected, so trailing pages are never fetched.
+    :param state_filter: Optional. Name of a batch state (e.g. ``SUCCEEDED``, ``FAILED``) to keep.
+        The installed client cannot push the predicate to the server, so the filter is applied
+        while streaming pages; non-matching batches are dropped before they reach XCom.
+    :param output_uri: Optional. A ``gs://`` prefix to write the listing to instead of XCom.
+        Each page is written as one NDJSON object under the prefix and only the object URIs
+        are returned, keeping megabyte-scale listings out of the metadata database. (templated)
+    :param summaries: Optional. When True each batch is converted through a specialized
+        accessor that returns only the commonly used fields (name, uuid, state,
+        state_message, create_time, labels), skipping the per-field proto reflection of
+        ``Batch.to_dict``. Defaults to False to keep the full payload shape.
     :param retry: Optional, a retry object used  to retry requests. If `None` is specified, requests
         will not be retried.
     :param timeout: Optional, the amount of time, in seconds, to wait for the request to complete.
@@ -2291,7 +2701,7 @@ class DataprocListBatchesOperator(BaseOperator):
     :rtype: List[dict]
     """
 
-    template_fields: Sequence[str] = ("region", "project_id", "impersonation_chain")
+    template_fields: Sequence[str] = ("region", "project_id", "impersonation_chain", "output_uri")
 
     def __init__(
         self,
@@ -2300,6 +2710,10 @@ class DataprocListBatchesOperator(BaseOperator):
         project_id: Optional[str] = None,
         page_size: Optional[int] = None,
         page_token: Optional[str] = None,
+        limit: Optional[int] = None,
+        state_filter: Optional[str] = None,
+        output_uri: Optional[str] = None,
+        summaries: bool = False,
         retry: Optional[Retry] = None,
         timeout: Optional[float] = None,
         metadata: Sequence[Tuple[str, str]] = (),
@@ -2312,21 +2726,84 @@ class DataprocListBatchesOperator(BaseOperator):
         self.project_id = project_id
         self.page_size = page_size
         self.page_token = page_token
+        self.limit = limit
+        self.state_filter = state_filter
+        self.output_uri = output_uri
+        self.summaries = summaries
         self.retry = retry
         self.timeout = timeout
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        # Only retry/timeout/metadata can be pre-bound: the id and location
+        # arguments are templated and resolve at render time.
+        self._api_request_kwargs = {'retry': retry, 'timeout': timeout, 'metadata': metadata}
+
+    @cached_property
+    def hook(self) -> DataprocHook:
+        """Hook shared per connection and reused across retries and resumes."""
+        return _cached_dataproc_hook(self.gcp_conn_id, self.impersonation_chain)
 
     def execute(self, context: 'Context'):
-        hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        hook = self.hook
         results = hook.list_batches(
             region=self.region,
             project_id=self.project_id,
             page_size=self.page_size,
             page_token=self.page_token,
-            retry=self.retry,
-            timeout=self.timeout,
-            metadata=self.metadata,
+            **self._api_request_kwargs,
         )
-        return [Batch.to_dict(result) for result in results]
+        if self.output_uri is not None:
+            return self._write_pages_to_gcs(results)
+        if not self.do_xcom_push:
+            # Without an XCom push or an output_uri the converted list would be
+            # thrown away; skip the conversion pass entirely.
+            return None
+        # The pager fetches lazily; converting while iterating lets each page's
+        # protos be released instead of holding the whole listing twice, and a
+        # limit stops pagination before trailing pages are requested.
+        convert = _batch_to_summary_dict if self.summaries else Batch.to_dict
+        batches = []
+        for result in results:
+            if self.state_filter is not None and result.state.name != self.state_filter:
+                continue
+            batches.append(convert(result))
+            if self.limit is not None and len(batches) >= self.limit:
+                break
+        return batches
+
+    def _write_pages_to_gcs(self, results) -> List[str]:
+        """Write each listing page as NDJSON under ``output_uri`` and return the object URIs."""
+        if not self.output_uri.startswith('gs://'):
+            raise AirflowException('output_uri must be a gs:// URI')
+        bucket_name, _, base_object = self.output_uri[len('gs://') :].partition('/')
+        prefix = f"{base_object.rstrip('/')}/" if base_object else ""
+        gcs_hook = GCSHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        uris = []
+        written = 0
+        for page_index, page in enumerate(results.pages):
+            # MessageToJson serializes the raw proto straight to JSON in one
+            # hop, skipping the intermediate dict that Batch.to_dict would
+            # allocate for every entry.
+            lines = [
+                MessageToJson(Batch.pb(result), preserving_proto_field_name=True, indent=None)
+                for result in page
+                if self.state_filter is None or result.state.name == self.state_filter
+            ]
+            # The limit applies to the spooled listing too, so the last page
+            # is truncated and pagination stops before trailing pages are
+            # requested.
+            if self.limit is not None:
+                lines = lines[: self.limit - written]
+            if not lines:
+                if self.limit is not None and written >= self.limit:
+                    break
+                continue
+            object_name = f"{prefix}page_{page_index:05d}.ndjson"
+            gcs_hook.upload(bucket_name=bucket_name, object_name=object_name, data='\n'.join(lines))
+            uris.append(f"gs://{bucket_name}/{object_name}")
+            written += len(lines)
+            if self.limit is not None and written >= self.limit:
+                break
+        self.log.info("Wrote %d listing pages under %s", len(uris), self.output_uri)
+        return uris
@@ -0,0 +1,313 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+"""This module contains Google Dataproc triggers."""
+
+import asyncio
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from google.api_core.exceptions import NotFound
+from google.api_core.retry import exponential_sleep_generator
+from google.cloud.dataproc_v1 import Batch, JobStatus
+
+from airflow.providers.google.cloud.hooks.dataproc import DataprocAsyncHook
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+
+class DataprocClusterTrigger(BaseTrigger):
+    """
+    Trigger that asynchronously polls a Dataproc cluster until it leaves a pending state.
+
+    The trigger runs on the triggerer so that no worker slot is blocked while the
+    cluster is provisioned or torn down. For clusters being created the trigger
+    fires as soon as the cluster is no longer ``CREATING``, for clusters being
+    deleted it fires once the cluster can no longer be found.
+
+    :param cluster_name: The name of the cluster to poll.
+    :param region: The Cloud Dataproc region in which to handle the request.
+    :param project_id: The ID of the Google Cloud project the cluster belongs to.
+    :param pending_state: Name of the cluster state the trigger waits to leave.
+        Supported values are ``CREATING`` and ``DELETING``.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+    :param polling_interval_seconds: Initial number of seconds to wait between cluster polls.
+        The interval grows exponentially up to two minutes, mirroring the synchronous
+        wait it replaces.
+    """
+
+    def __init__(
+        self,
+        cluster_name: str,
+        region: str,
+        project_id: Optional[str] = None,
+        pending_state: str = "CREATING",
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        polling_interval_seconds: int = 10,
+    ):
+        super().__init__()
+        self.cluster_name = cluster_name
+        self.region = region
+        self.project_id = project_id
+        self.pending_state = pending_state
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+        self.polling_interval_seconds = polling_interval_seconds
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "airflow.providers.google.cloud.triggers.dataproc.DataprocClusterTrigger",
+            {
+                "cluster_name": self.cluster_name,
+                "region": self.region,
+                "project_id": self.project_id,
+                "pending_state": self.pending_state,
+                "gcp_conn_id": self.gcp_conn_id,
+                "impersonation_chain": self.impersonation_chain,
+                "polling_interval_seconds": self.polling_interval_seconds,
+            },
+        )
+
+    async def run(self):
+        hook = DataprocAsyncHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        for time_to_sleep in exponential_sleep_generator(initial=self.polling_interval_seconds, maximum=120):
+            try:
+                cluster = await hook.get_cluster(
+                    project_id=self.project_id, region=self.region, cluster_name=self.cluster_name
+                )
+            except NotFound:
+                if self.pending_state == "DELETING":
+                    yield TriggerEvent({"cluster_name": self.cluster_name, "cluster_state": "DELETED"})
+                    return
+                raise
+            state = cluster.status.state
+            if state.name != self.pending_state:
+                yield TriggerEvent({"cluster_name": self.cluster_name, "cluster_state": state.name})
+                return
+            self.log.info(
+                "Cluster %s is still in %s state, sleeping for %s seconds",
+                self.cluster_name,
+                self.pending_state,
+                time_to_sleep,
+            )
+            await asyncio.sleep(time_to_sleep)
+
+
+class DataprocOperationTrigger(BaseTrigger):
+    """
+    Trigger that asynchronously polls a long-running Dataproc operation until it completes.
+
+    It is used to wait for workflow template instantiations and cluster updates
+    without blocking a worker slot on ``operation.result()``.
+
+    :param name: Required. The fully qualified name of the operation resource to poll.
+    :param region: The Cloud Dataproc region in which to handle the request.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+    :param polling_interval_seconds: Initial number of seconds to wait between operation polls.
+        The interval grows exponentially up to two minutes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        region: str,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        polling_interval_seconds: int = 10,
+    ):
+        super().__init__()
+        self.name = name
+        self.region = region
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+        self.polling_interval_seconds = polling_interval_seconds
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "airflow.providers.google.cloud.triggers.dataproc.DataprocOperationTrigger",
+            {
+                "name": self.name,
+                "region": self.region,
+                "gcp_conn_id": self.gcp_conn_id,
+                "impersonation_chain": self.impersonation_chain,
+                "polling_interval_seconds": self.polling_interval_seconds,
+            },
+        )
+
+    async def run(self):
+        hook = DataprocAsyncHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        for time_to_sleep in exponential_sleep_generator(initial=self.polling_interval_seconds, maximum=120):
+            operation = await hook.get_operation(region=self.region, operation_name=self.name)
+            if operation.done:
+                if operation.error.message:
+                    status = "error"
+                    message = operation.error.message
+                else:
+                    status = "success"
+                    message = "Operation is successfully ended."
+                yield TriggerEvent({"operation_name": self.name, "status": status, "message": message})
+                return
+            self.log.info("Operation %s is not done yet, sleeping for %s seconds", self.name, time_to_sleep)
+            await asyncio.sleep(time_to_sleep)
+
+
+class DataprocSubmitTrigger(BaseTrigger):
+    """
+    Trigger that asynchronously polls a submitted Dataproc job until it reaches a terminal state.
+
+    All deferred submit-job tasks share the triggerer's event loop, so one
+    process polls every outstanding job instead of each task holding a worker
+    slot for its own wait_for_job loop.
+
+    :param dataproc_job_id: Required. The ID of the job to poll.
+    :param region: The Cloud Dataproc region in which to handle the request.
+    :param project_id: The ID of the Google Cloud project the job belongs to.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+    :param polling_interval_seconds: Initial number of seconds to wait between job polls.
+        The interval grows exponentially up to two minutes.
+    """
+
+    def __init__(
+        self,
+        dataproc_job_id: str,
+        region: str,
+        project_id: Optional[str] = None,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        polling_interval_seconds: int = 10,
+    ):
+        super().__init__()
+        self.dataproc_job_id = dataproc_job_id
+        self.region = region
+        self.project_id = project_id
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+        self.polling_interval_seconds = polling_interval_seconds
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "airflow.providers.google.cloud.triggers.dataproc.DataprocSubmitTrigger",
+            {
+                "dataproc_job_id": self.dataproc_job_id,
+                "region": self.region,
+                "project_id": self.project_id,
+                "gcp_conn_id": self.gcp_conn_id,
+                "impersonation_chain": self.impersonation_chain,
+                "polling_interval_seconds": self.polling_interval_seconds,
+            },
+        )
+
+    async def run(self):
+        hook = DataprocAsyncHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        terminal_states = {
+            JobStatus.State.DONE,
+            JobStatus.State.ERROR,
+            JobStatus.State.CANCELLED,
+        }
+        for time_to_sleep in exponential_sleep_generator(initial=self.polling_interval_seconds, maximum=120):
+            job = await hook.get_job(
+                job_id=self.dataproc_job_id, project_id=self.project_id, region=self.region
+            )
+            state = job.status.state
+            if state in terminal_states:
+                yield TriggerEvent({"job_id": self.dataproc_job_id, "job_state": state.name})
+                return
+            self.log.info(
+                "Job %s is in %s state, sleeping for %s seconds",
+                self.dataproc_job_id,
+                state.name,
+                time_to_sleep,
+            )
+            await asyncio.sleep(time_to_sleep)
+
+
+class DataprocBatchTrigger(BaseTrigger):
+    """
+    Trigger that asynchronously polls a Dataproc batch workload until it reaches a terminal state.
+
+    :param batch_id: Required. The ID of the batch to poll.
+    :param region: The Cloud Dataproc region in which to handle the request.
+    :param project_id: The ID of the Google Cloud project the batch belongs to.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+    :param polling_interval_seconds: Initial number of seconds to wait between batch polls.
+        The interval grows exponentially up to two minutes.
+    """
+
+    def __init__(
+        self,
+        batch_id: str,
+        region: str,
+        project_id: Optional[str] = None,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: Optional[Union[str, Sequence[str]]] = None,
+        polling_interval_seconds: int = 10,
+    ):
+        super().__init__()
+        self.batch_id = batch_id
+        self.region = region
+        self.project_id = project_id
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+        self.polling_interval_seconds = polling_interval_seconds
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "airflow.providers.google.cloud.triggers.dataproc.DataprocBatchTrigger",
+            {
+                "batch_id": self.batch_id,
+                "region": self.region,
+                "project_id": self.project_id,
+                "gcp_conn_id": self.gcp_conn_id,
+                "impersonation_chain": self.impersonation_chain,
+                "polling_interval_seconds": self.polling_interval_seconds,
+            },
+        )
+
+    async def run(self):
+        hook = DataprocAsyncHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
+        terminal_states = {
+            Batch.State.SUCCEEDED,
+            Batch.State.FAILED,
+            Batch.State.CANCELLED,
+        }
+        for time_to_sleep in exponential_sleep_generator(initial=self.polling_interval_seconds, maximum=120):
+            batch = await hook.get_batch(
+                batch_id=self.batch_id, region=self.region, project_id=self.project_id
+            )
+            state = batch.state
+            if state in terminal_states:
+                yield TriggerEvent({"batch_id": self.batch_id, "batch_state": state.name})
+                return
+            self.log.info(
+                "Batch %s is in %s state, sleeping for %s seconds",
+                self.batch_id,
+                state.name,
+                time_to_sleep,
+            )
+            await asyncio.sleep(time_to_sleep)